@@ -10,6 +10,11 @@ from exceptionsLibrary import TabFileException, TabConfigurationException
 from configUtils import ConfigOptionID
 import re
 
+DIGITS = frozenset("0123456789") # fret digits, only ASCII digits are allowed in frets so this replaces 'str.isdigit()' which also accepts other Unicode digits
+STRING_EVENT_PATTERN = re.compile(r'[0-9|]') # matches the characters in a string list that 'updateSong()' has to act on: fret digits and measure lines
+MEASURE_LINE_COLUMN = ("|",) * 4 # what the 4 string lists hold at a column with a proper measure line
+LINE_CACHE_SIZE = 1024 # max. no. of lines 'buildSong()' remembers the checks of (see 'buildSong()'), the caches are emptied when they fill up so memory use stays bounded on large input files
+
 """
 Returns whether or not a given character string represents a timing line. That is, it is made entirely of the characters in 'Song.allowedTimingChars'.
 
@@ -18,9 +23,12 @@ line - a character string
 
 pre-condition:
 'line' is not just whitespace. If this has not been checked, a line made up of whitespace would be counted as a valid timing line.
+
+Note: most lines that aren't timing lines are rejected by looking up their 1st character in 'Song.timingCharSet' (which holds the same characters) before the
+regex is run. The regex itself is compiled once when the timing data is loaded (see Song class doc.).
 """
 def isTimingLine(line):
-    return re.match(r'^[{0}]+$'.format(Song.allowedTimingChars), line) is not None
+    return line[:1] in Song.timingCharSet and Song.timingLinePattern.match(line) is not None
 
 """
 Extracts the string data from a character string.
@@ -33,52 +41,64 @@ Extra text is allowed in 'line' and is assumed to be any text without a "|" befo
 
 Note: extra text is not allowed to separate string data. Example: say 'line=|--1--| extra |--2--|'. The string data is identified as |--1--|.
 
+Returns a 3-tuple of character strings: the extra text before the string data, the string data, and the extra text after the string data.
 If a substring with this pattern cannot be found, 'None' is returned.
 """
 def extractStringData(line):
-    return re.match(r'^([^\|]*)(\|[{0}]+\|)(.*)$'.format(Song.allowedPlayingChars), line)
+    first = line.find("|") # the string data has to begin at the 1st "|" as the extra text before it can not hold one
+    last = line.rfind("|") # the string data can not end past the last "|"
+    if last - first < 2: # there must be at least 1 character between the "|"s that begin and end the string data (this also covers 'line' not holding a "|")
+        return None
+    # in the usual case, everything between the 1st and last "|" is string data. That can be checked with 2 searches and a set test instead of running a regex over 'line'
+    data = line[first:last + 1]
+    if Song.playingCharSet.issuperset(data):
+        return (line[:first], data, line[last + 1:])
+    # otherwise, there's extra text after the string data that holds a "|" or the string data holds an invalid character. Let the regex find where the string data ends (if it is there at all)
+    match = Song.stringDataPattern.match(line) # compiled once when the playing legend is loaded (see Song class doc.)
+    if match is None:
+        return None
+    return match.groups()
 
 """
-Parses a given note. Here a note is represented as being at a given index in a given list for one of the four strings. 
-This method places this note into a Slice which wraps the conversion procedure (see its doc. in typeLibrary.py).
+Finds the columns of the string lists (and timing list) that 'updateSong()' needs to look at. That is, the columns where at least 1 of the string lists holds a digit or a
+measure line or where the timing list holds a timing symbol. At any other column, 'updateSong()' would only build an empty Slice and move on to the next column so those
+columns can be skipped entirely. The scanning itself is done by compiled regular expressions over the character strings instead of a Python loop over every column.
 
 params:
-string - an array representing a guitar string
-idx - position of 1st digit of the fret on the strings
-slice - Slice to add the note to
-stringID - character ID of the guitar string
-
-Returns a 2-element tuple t:
-    t[0] - a boolean value reporting whether or not the next index should be skipped. This occurs when a string list has a 2-digit
-    fret. Thus, the following index of the string list should not be looked at and though of as a separate note. Therefore, if
-    the user overlaps 2 notes that have 2-digit fret numbers, they will get an incorrect output. 
-    t[1] - a boolean value reporting whether or not a note was successfully parsed. That is, whether string[idx] (or string[idx]+string[idx+1])
-    represent a 1 (or 2) digit fret number. If string[idx] was a hyphen, bar line, or some other character from Song.playingLegend,
-    t[1] will be false. This is used by 'updateSong()' to report if the user has specified that timing is supplied but placed a note at
-    string[idx] with no timing symbol above it (at notes[idx]).
-
-Raises TabFileException if slice.addNote() fails.
+notes - character string of timing info. (empty if timing was not supplied)
+gString - representation of G-string
+dString - representation of D-string
+aString - representation of A-string
+eString - representation of E-string
+
+Returns a 3-element tuple t:
+    t[0] - a sorted list of the column indexes to visit.
+    t[1] - the set of column indexes where 'notes' holds a timing symbol (a key of 'Song.timingLegend'). This is a subset of t[0] and is empty if 'notes' is empty.
+    It replaces checking 'notes[i] in Song.timingLegend' at every visited column.
+    t[2] - a dict that maps a column index to the number of consecutive 'Song.dotSymbol' that immediately follow it in 'notes'. Columns not followed by a dot are not
+    in the dict. It replaces walking forward through 'notes' to count the dots at every timing symbol.
 """
-def parseNote(string, idx, slice, stringID):
-    skip = False
-    noteFound = False
-    fret = string[idx]
-    if fret.isdigit():
-        noteFound = True
-        if idx < len(string) - 1 and string[idx + 1].isdigit(): # found a 2-digit fret number, update fret variable
-            fret += string[idx + 1]
-            skip = True # skip reading the next index in the string as its fret value is considered as part of this note
-        # else: fret is only 1 digit, do nothing
-        slice.addNote(stringID, fret)
-    # else: fret is not a valid fret, it is a "-" or "|", do nothing
-    return (skip, noteFound)
+def findEventColumns(notes, gString, dString, aString, eString):
+    timingColumns = set()
+    dotRuns = dict()
+    if notes:
+        # the patterns only depend on the timing config. so they are compiled once when it is loaded (see Song class doc.) rather than on each call
+        timingColumns.update(m.start() for m in Song.timingSymbolPattern.finditer(notes))
+        dotRuns.update((m.start() - 1, m.end() - m.start()) for m in Song.dotRunPattern.finditer(notes)) # a run of dots belongs to the column right before it
+    # the 4 string lists are scanned in 1 pass by joining them with a newline (which can't be in a string list). As the lists have the same length, each string list takes up
+    # 'width' characters of the joined string and a match's column is its position in the joined string modulo 'width'
+    width = len(gString) + 1
+    joinedStrings = "\n".join((gString, dString, aString, eString))
+    columns = set(timingColumns)
+    columns.update(m.start() % width for m in STRING_EVENT_PATTERN.finditer(joinedStrings))
+    return (sorted(columns), timingColumns, dotRuns)
 
 """
 Updates a Song object given a subset of the input data stored as a group of lists.
 
 params:
 song - a Song object to be updated
-notes - list of timing info.
+notes - character string of timing info.
 gString - representation of G-string
 dString - representation of D-string
 aString - representation of A-string
@@ -87,70 +107,99 @@ lastSlice - last Slice to be added to 'song'
 
 pre-conditions:
 if notes is not empty, it should have the same length as the string lists (gString, dString, aString, and eString)
-if timing has been provided, then Song.timingLegend, Song.tieSymbol, and Song.dotSymbol should all have been updated from config. file
+if timing has been provided, then Song.timingLegend, Song.tieSymbol, Song.dotSymbol, Song.timingSymbolPattern, and Song.dotRunPattern should all have been updated from config. file
 
 Returns the last Slice to be added to 'song', replaces param. 'lastSlice'
 
+Note: the notes found in all 4 string lists at a given column are parsed together in 1 pass. If a string list has a 2-digit fret at a column, the following column is
+skipped for all the string lists as it is considered part of that fret. Therefore, if the user overlaps 2 notes that have 2-digit fret numbers, they will get an incorrect output.
+
 Raises TabConfigurationException if the Slice class' mapping from timing symbols to timing lengths was not loaded.
-Raises TabFileException if helper method parseNote() fails, Slice.setLength() fails, an improper measure line was detected, or a note on a string line didn't correspond to a timing symbol (if timing was given).
+Raises TabFileException if Slice.addNote() fails, Slice.setLength() fails, an improper measure line was detected, or a note on a string line didn't correspond to a timing symbol (if timing was given).
     - For the first 2, see their method doc. in typeLibrary.py
     - For the last, a line no. isn't provided, so 'buildSong()' catches the exception and raises a new one with a line no. (using loadedLines[0], see 'buildSong()' method doc.)
-Raises TabException if Slice.applyDot() or Slice.tie() fail (see their doc.)
-Raises MeasureException if Song.addMeasure() fails (see its doc.)
+Raises TabException if Slice.applyDots() or Slice.tie() fail (see their doc.)
+Raises MeasureException if Song.validateMeasure() or Song.addMeasures() fail (see their doc.)
 """
 def updateSong(song, notes, gString, dString, aString, eString, lastSlice):
-    measure = Measure() # temp. var. to store Measure currently being built. It is reset after being added to 'song'
-    i = 0
-    while i < len(gString):
-        slice = Slice() # Slice being built from the data at index 'i' in the lists
+    measure = Measure() # temp. var. to store Measure currently being built. It is reset after being added to 'measures'
+    measures = list() # Measures completed in this call, they are added to 'song' together at the end of the method
+    addSlice = measure.addSlice # bound method of 'measure' kept in a local so it isn't looked up at each Slice, must be rebound whenever 'measure' is reset
+    strings = tuple(zip((gString, dString, aString, eString), Song.STRING_NAMES)) # pairs each string list with its string name, in the order the notes are added to a Slice
+    lastColumn = len(gString) - 1
+    # load the timing config. data and other repeatedly used values into local variables so they aren't looked up on the Song class (or recomputed) at every column
+    digits = DIGITS
+    tieSymbol = Song.tieSymbol
+    columns, timingColumns, dotRuns = findEventColumns(notes, gString, dString, aString, eString)
+    nextColumn = 0 # smallest column that can still be visited, columns before it are skipped because of dots or 2-digit frets (see end of loop)
+    for i in columns: # only visit the columns that could change 'song' (see 'findEventColumns()' doc.)
+        if i < nextColumn:
+            continue
+        # Slice being built from the data at index 'i' in the lists. It is only created once the column is known to hold a timing symbol or a note, so columns that
+        # only hold a measure line (or playing legend characters) don't allocate a Slice that would be thrown away. Thus, 'slice' is None iff no Slice is to be added at 'i'
+        slice = None
+        hasTimingSymbol = i in timingColumns # precomputed by 'findEventColumns()', reused below
 
         # at a given index 'i', if 'notes[i]' is a timing id but all the string lists at index 'i' hold non-digits, this indicates a rest. Therefore, by going through 'notes' and "looking below" at the string lists, rests can be accounted for
-        # and the notes in the string lists can be added after if they are present (see 4 calls to 'parseNote()' below)
+        # and the notes in the string lists can be added after if they are present (see the note parsing loop below)
         # WARNING: b/c of this, putting a timing symbol above a measure line will cause this to interpret it as a rest!
-        if notes and notes[i] in Song.timingLegend:
+        if hasTimingSymbol:
+            slice = Slice()
             slice.setLength(notes[i])
-            j = i + 1
-            while j < len(notes) and notes[j] == Song.dotSymbol: # apply any following dots, as rests can be dotted
-                slice.applyDot()
-                j += 1     
+            slice.applyDots(dotRuns.get(i, 0)) # apply any following dots (precomputed by 'findEventColumns()'), as rests can be dotted
         # otherwise, do nothing to the slice length 
       
-        gStrParseResult = parseNote(gString, i, slice, "G")
-        dStrParseResult = parseNote(dString, i, slice, "D")
-        aStrParseResult = parseNote(aString, i, slice, "A")
-        eStrParseResult = parseNote(eString, i, slice, "E")
-        
+        skip = False # whether or not the next index should be skipped, that is if any of the string lists has a 2-digit fret at 'i'
+        for string, stringID in strings:
+            fret = string[i]
+            if fret in digits:
+                if slice is None: # 1st note found at a column without a timing symbol
+                    slice = Slice()
+                if i < lastColumn and string[i + 1] in digits: # found a 2-digit fret number, update fret variable
+                    fret += string[i + 1]
+                    skip = True # skip reading the next index in the strings as its fret value is considered as part of this note
+                # else: fret is only 1 digit, do nothing
+                slice.addNote(stringID, fret)
+            # else: fret is not a valid fret, it is a "-" or "|", do nothing
+
         # if the user specified timing is supplied but a note is located on 1 of the 4 strings at an index in the string lists where no
         # corresponding timing symbol has been supplied, raise an error 
-        if notes and notes[i] not in Song.timingLegend and (gStrParseResult[1] or dStrParseResult[1] or aStrParseResult[1] or eStrParseResult[1]):
+        if notes and not hasTimingSymbol and slice is not None: # without a timing symbol, 'slice' can only have been created by finding a note
             raise TabFileException("improperly formatted note", "Timing was supplied but no timing symbol could be found at around column {0}".format(i))
         # otherwise, timing as provided and notes[i] isn't a timing symbol
 
-        if i > 0 and notes and notes[i] in Song.timingLegend and notes[i - 1] == Song.tieSymbol: # only tie Slices after notes have been added, otherwise 'lastSlice' and 'slice' could have differing note counts as the count of 'slice' would be 0
+        if i > 0 and hasTimingSymbol and notes[i - 1] == tieSymbol: # only tie Slices after notes have been added, otherwise 'lastSlice' and 'slice' could have differing note counts as the count of 'slice' would be 0
             lastSlice.tie(slice)
 
-        if slice.isRest() or not slice.isEmpty():
-            measure.addSlice(slice)
+        if slice is not None: # 'slice' holds a timing symbol (and so is a rest if it is empty) or at least 1 note
+            addSlice(slice)
             lastSlice = slice
         else:
             # the following 2 if-statements can be summarized as follows: if the string list entry at index 'i' is a measure line, then the entries at 'i' for all the other 3 string lists must also be a measure line. Otherwise, raise an error
-            if gString[i] == "|" or dString[i] == "|" or aString == "|" or eString[i] == "|":
-                if gString[i] != "|" or dString[i] != "|" or aString[i] != "|" or eString[i] != "|":
+            # the 4 entries are gathered into 1 tuple so both checks are single C-level comparisons instead of chains of 4 indexed comparisons
+            column = (gString[i], dString[i], aString[i], eString[i])
+            if "|" in column:
+                if column != MEASURE_LINE_COLUMN:
                     raise TabFileException("improper measure line detected", "Not all string lists have a \"|\" at around column {0}".format(i))
                 if not measure.isEmpty():
-                    song.addMeasure(measure)
+                    # the Measure is checked as soon as it is closed by the measure line (as opposed to when 'measures' is added to 'song' at the end of the method), so that an invalid
+                    # Measure is reported before any error found in the columns after it
+                    song.validateMeasure(measure, song.numMeasures() + len(measures))
+                    measures.append(measure)
                     measure = Measure()
+                    addSlice = measure.addSlice
                 # else don't add empty Measures to the Song
             # else all the characters in the string lists at this index don't matter: they are members of the playing legend or are "-"
 
-        # update 'i' accordingly with the knowledge that indexes with dots in 'notes' can be skipped (as there should be no notes below them) and can skip with a note with a double digit fret is encountered. See README for more info. on the latter case.
-        if slice.getDotCount() > 0:
-            i += slice.getDotCount()
-        # if any one of the strings had a 2-digit fret, skip the next index (i) (more discussed in method doc. for 'parseNote()')
-        elif gStrParseResult[0] or dStrParseResult[0] or aStrParseResult[0] or eStrParseResult[0]:
-            i += 2
+        # update 'nextColumn' accordingly with the knowledge that indexes with dots in 'notes' can be skipped (as there should be no notes below them) and can skip with a note with a double digit fret is encountered. See README for more info. on the latter case.
+        if slice is not None and slice.getDotCount() > 0:
+            nextColumn = i + slice.getDotCount()
+        # if any one of the strings had a 2-digit fret, skip the next index (i) (more discussed in the method doc.)
+        elif skip:
+            nextColumn = i + 2
         else: # fret was only 1 digit, thus the next index (i) must be processed (and not skipped)
-            i += 1
+            nextColumn = i + 1
+    song.addMeasures(measures)
     return lastSlice # return updated last Slice to be added to 'song'
 
 """
@@ -215,17 +264,20 @@ def saveSameLineExtraText(sameLineText, str):
     return sameLineText
 
 """
-Builds a Song given the list of lines read from the input file and configuration data loaded by the method run(). At the end of
+Builds a Song given the lines of the input file and configuration data loaded by the method run(). At the end of
 this method, if it completes successfully, the data from the input tab file will have been parsed and stored appropriately in
 Song, Measure, and Slice objects.
 
 params:
-lines - list of lines read from input file
+lines - iterable of the lines of the input file (e.g. the open input file itself or a list of lines). The lines are read 1 at a time and are not kept after being parsed,
+so the whole input file does not have to be held in memory.
 song - Song object that will be loaded with Measures and Slices
 rdr - ConfigReader that holds program config. data
 loadedLines - array used to report info. on progress of parsing 'lines' to main method 'run()' since Python lists are passed by ref.
     loadedLines[0] - number of lines read
     loadedLines[1] - number of lines interpreted as string/timing lines
+Every line in 'lines' is parsed from the 1st one on. Lines are not skipped based on 'loadedLines', its values are only the counts the method starts counting from (normally [0, 0]).
+They are updated in place as the lines are parsed.
 
 Raises TabFileException if any of the following occur:
     - lengths of strings and timing lines are unequal
@@ -242,11 +294,13 @@ Furthermore, in the event of helper method updateSong() failing, the following e
 The reasons as to why these exceptions could be raised seemed to lengthy to add here. Instead, look at the doc. for 'updateSong()'.
 """
 def buildSong(lines, song, rdr, loadedLines):
-    notes = list() # list that holds timing info
-    gString = list() # list that holds data from g-string (fret numbers, measure lines, dashes, and anything in 'legend')
-    dString = list() # list that holds data from d-string ("                                                           ")
-    aString = list() # list that holds data from a-string ("                                                           ")
-    eString = list() # list that holds data from e-string ("                                                           ")
+    # the timing and string data are kept as character strings (not lists of 1-character strings) as they are only ever indexed, sliced, and measured. This avoids building a list
+    # with 1 object per column for each line and lets the scans in 'findEventColumns()' run over them directly
+    notes = "" # holds timing info
+    gString = "" # holds data from g-string (fret numbers, measure lines, dashes, and anything in 'legend')
+    dString = "" # holds data from d-string ("                                                           ")
+    aString = "" # holds data from a-string ("                                                           ")
+    eString = "" # holds data from e-string ("                                                           ")
 
     # load repeatedly called config. options into tmp. variables so internal checks by ConfigReader aren't done each timing the setting needs to be retrieved (see ConfigReader's doc.). This is safe as it is known that the config. options will not be edited in this method
     hasTiming = rdr.getSettingForOption(ConfigOptionID.TIMING_SUPPLIED)
@@ -254,73 +308,107 @@ def buildSong(lines, song, rdr, loadedLines):
     tabSpacing = rdr.getSettingForOption(ConfigOptionID.TAB_SPACING)
     keepExtra = rdr.getSettingForOption(ConfigOptionID.KEEP_EXTRA)
 
-    if hasTiming and (len(Song.timingLegend) == 1 or not Song.tieSymbol or not Song.dotSymbol):
+    if hasTiming and (len(Song.timingLegend) == 1 or not Song.tieSymbol or not Song.dotSymbol or Song.timingSymbolPattern is None):
         raise TabConfigurationException(reason="program configuration failed. Timing legend was not loaded properly",line=ConfigOptionID.TIMING_SYMBOLS.value+1)
 
+    # if user has specified that timing was supplied, lines are read in groups of 5 (a timing line followed by the 4 string lines). Otherwise, lines are read in groups of 4 (just the string lines).
+    # 'timingOffset' is the no. of lines in a group that come before the G-string line, so that the string line at 'phase' in the group is 'Song.STRING_NAMES[phase - timingOffset]'
+    groupSize = 5 if hasTiming else 4
+    timingOffset = 1 if hasTiming else 0
+    timingPhase = 0 if hasTiming else -1 # phase at which a timing line is expected. 'phase' is never -1, so when timing wasn't supplied the timing line check below is never taken without having to test 'hasTiming' on each line
+    phase = loadedLines[1] % groupSize # position of the next expected string/timing line in its group, kept in step with the no. of string/timing lines by wrapping it back to 0 at the end of a group instead of taking a modulo on every line
+
     startingText = "" # holds the extra text that occurs before - but on the same line as - the string data stored in notes, gString, dString, etc.
     endingText = "" # holds the extra text that occurs after - but on the same line as - the string data stored in notes, gString, dString, etc.
     lastSlice = Slice() # holds last Slice to be added to the Song. This is kept updated by calls to 'updateSong()'
-    while loadedLines[0] < len(lines): # iterates over lines to be read
-         # (1) All whitespace should be stripped from the end of any line. In the case of empty lines, this will convey the same message as stripping both ends of the line of whitespace. For timing lines,
-        # this allows the proper number of spaces to be added at the end of notes line as explained in the method doc. for this method. For string lines, this will solve the issue
-        # of different string lines having different amounts of whitespace at the end and making sure they too have the same length as the timing lines with the new spaces.
-        # (2) In order to ensure that the 5 lists above are the same length, all tabs must be converted into spaces. That way, the notes list can be properly expanded or reduced to maintain
-        # note alignment (on string lines) with their timing symbols (on timing lines above them).
-        sLine = lines[loadedLines[0]].rstrip().expandtabs(tabSpacing)
-        if len(sLine) == 0: # 'sLine' was empty
-            loadedLines[0] += 1
-            if (hasTiming and loadedLines[1] % 5 == 0) or (not hasTiming and loadedLines[1] % 4 == 0): # this makes sure that only empty lines that are not in between string/timing lines are added to the extra text in 'song'
-                song.placeExtraLine(" ", song.numMeasures(), ExtraTextPlacementOption.FOLLOWING_LINE)  # since extra text lists are initialized to hold the empty string, make sure that an empty line is conveyed by at least 1 space or tab character. That way, it will actually be displayed in the output.
-            # else: this is an empty line in between strings, ignore it
-            continue
-
-        if hasTiming: # if user has specified that timing was supplied -> read lines in groups of 5, and note lines must be checked for
-            if loadedLines[1] % 5 == 0: # if any multiple of 5 lines has been read, the next line should be a note line if input file is valid.
-                if isTimingLine(sLine):
-                    notes = list(sLine)
-                    loadedLines[1] += 1
+    # tabs tend to repeat the same lines (e.g. timing patterns, empty measures, separators), and the result of checking a line only depends on the line and the config., which does not
+    # change in this method. So the results of 'isTimingLine()' and 'extractStringData()' are remembered by line and reused when an identical line is read again
+    timingLineCache = dict()
+    stringDataCache = dict()
+    placeExtraLine = song.placeExtraLine # bound method of 'song' kept in a local so it isn't looked up each time extra text is placed
+    # the progress counters are kept in locals while the lines are read so each line does not index into the shared 'loadedLines' list. They are written back once the loop finishes,
+    # and also when it is left by an exception so that 'run()' can still report how far parsing got
+    lineIdx = loadedLines[0]
+    stringCount = loadedLines[1]
+    try:
+        for line in lines: # iterates over lines to be read
+             # (1) All whitespace should be stripped from the end of any line. In the case of empty lines, this will convey the same message as stripping both ends of the line of whitespace. For timing lines,
+            # this allows the proper number of spaces to be added at the end of notes line as explained in the method doc. for this method. For string lines, this will solve the issue
+            # of different string lines having different amounts of whitespace at the end and making sure they too have the same length as the timing lines with the new spaces.
+            # (2) In order to ensure that the 5 lists above are the same length, all tabs must be converted into spaces. That way, the notes list can be properly expanded or reduced to maintain
+            # note alignment (on string lines) with their timing symbols (on timing lines above them).
+            sLine = line.rstrip() # this also strips the line ending if 'lines' keeps them (as file objects do)
+            if "\t" in sLine: # 'expandtabs()' scans and copies the whole line even when there are no tabs to expand, so only call it when it is needed
+                sLine = sLine.expandtabs(tabSpacing)
+            if len(sLine) == 0: # 'sLine' was empty
+                lineIdx += 1
+                if phase == 0: # this makes sure that only empty lines that are not in between string/timing lines are added to the extra text in 'song'
+                    placeExtraLine(" ", song.numMeasures(), ExtraTextPlacementOption.FOLLOWING_LINE)  # since extra text lists are initialized to hold the empty string, make sure that an empty line is conveyed by at least 1 space or tab character. That way, it will actually be displayed in the output.
+                # else: this is an empty line in between strings, ignore it
+                continue
+
+            if phase == timingPhase: # if timing was supplied and any multiple of 5 lines has been read, the next line should be a note line if input file is valid.
+                isTiming = timingLineCache.get(sLine)
+                if isTiming is None: # 'sLine' hasn't been checked yet
+                    if len(timingLineCache) >= LINE_CACHE_SIZE:
+                        timingLineCache.clear()
+                    isTiming = timingLineCache[sLine] = isTimingLine(sLine)
+                if isTiming:
+                    notes = sLine
+                    stringCount += 1
+                    phase += 1 # a timing line always starts a group, so 'phase' can not wrap here
                 else: # otherwise, record it as a line of extra text (if desired by user) following the current number of measures in Song
                     if keepExtra:
-                        song.placeExtraLine(sLine, song.numMeasures(), ExtraTextPlacementOption.FOLLOWING_LINE)
-            else: # note at this point loadedLines[1] % 5 is in [1, 4]
+                        placeExtraLine(sLine, song.numMeasures(), ExtraTextPlacementOption.FOLLOWING_LINE)
+            else: # note at this point 'phase - timingOffset' is in [0, 3], that is the next line should be a string line
+                stringIdx = phase - timingOffset # index of the expected string's name in 'Song.STRING_NAMES'
                 orig = len(sLine) # length of char. string before any changes
-                arr = list()
-                if hasExtra: # if there is extra text, extract string data into a match object with 3 groups: group 1 is the extra text before the string data, group 2 is the string data, and group 3 is the extra text after the string data
-                    match = extractStringData(sLine)
-                    if match is not None: # match object was created successfully, so string data was found.
-                        arr = list(match.group(2))
+                arr = ""
+                if hasExtra: # if there is extra text, extract string data into a 3-tuple: index 0 is the extra text before the string data, index 1 is the string data, and index 2 is the extra text after the string data
+                    if sLine in stringDataCache:
+                        match = stringDataCache[sLine]
+                    else: # 'sLine' hasn't been checked yet
+                        if len(stringDataCache) >= LINE_CACHE_SIZE:
+                            stringDataCache.clear()
+                        match = stringDataCache[sLine] = extractStringData(sLine)
+                    if match is not None: # string data was found.
+                        arr = match[1]
                         if keepExtra:
-                            # save the starting and ending extra text using helper 'saveSameLineExtraText()' by extracting capture group data from the regex match
-                            startingText = saveSameLineExtraText(startingText, removeStringName(match.group(1), Song.STRING_NAMES[(loadedLines[1] % 5)-1], loadedLines[0] + 1))
-                            endingText = saveSameLineExtraText(endingText, match.group(3))
-                        #  else: this line does not have string data as the match was either None or not created properly
+                            # save the starting and ending extra text using helper 'saveSameLineExtraText()' by taking the extra text out of the extracted tuple
+                            startingText = saveSameLineExtraText(startingText, removeStringName(match[0], Song.STRING_NAMES[stringIdx], lineIdx + 1))
+                            endingText = saveSameLineExtraText(endingText, match[2])
+                    #  else: this line does not have string data
                 else: # if there's no extra text, should only be whitespace at the start -> strip it
-                    arr = list(sLine.lstrip())
+                    arr = sLine.lstrip()
                     if arr[0].isalpha(): # if the first non-whitespace char. in 'arr' is in the alphabet, it must be the correct string name corresponding to the current string to be parsed.
-                        checkChrToStringName(arr[0].upper(), Song.STRING_NAMES[(loadedLines[1] % 5) - 1], loadedLines[0] + 1)
+                        checkChrToStringName(arr[0].upper(), Song.STRING_NAMES[stringIdx], lineIdx + 1)
                 if not hasExtra or match is not None:
-                    if loadedLines[1] % 5 == 1:
+                    if stringIdx == 0:
                         gString = arr
-                        trim = 0 # trim holds the no. of spaces to be removed from the beginning of 'notes' and is calculated from the match obj. if there is extra text or the amount of whitespace at the beginning of 'gString' if there's no extra text
-                        if hasExtra:
-                            trim = len(match.group(1))
-                        else:
-                            trim = orig - len(gString)
-                        notes = notes[trim:] # using python 'list slicing', removes 'trim' spaces from the front of notes
-                        # need to update the last addition to the notes list to add spaces to make the timing line of the input file have the same length as the g-string list below it
-                        # otherwise, for input files where tabs may be on separate lines, the notes' timings would not be above the 1st digit of the fret of the note corresponding
-                        # to it. This is what is needed in the helper method 'updateSong()' in order to properly parse the input data and load it into a 'song'
-                        for i in range(len(notes), len(gString)):
-                            notes.append(" ")
-                    elif loadedLines[1] % 5 == 2:
+                        if hasTiming:
+                            trim = 0 # trim holds the no. of spaces to be removed from the beginning of 'notes' and is calculated from the extracted tuple if there is extra text or the amount of whitespace at the beginning of 'gString' if there's no extra text
+                            if hasExtra:
+                                trim = len(match[0])
+                            else:
+                                trim = orig - len(gString)
+                            # removes 'trim' spaces from the front of notes and then adds spaces to the end of it
+                            # need to update the last addition to the notes list to add spaces to make the timing line of the input file have the same length as the g-string list below it
+                            # otherwise, for input files where tabs may be on separate lines, the notes' timings would not be above the 1st digit of the fret of the note corresponding
+                            # to it. This is what is needed in the helper method 'updateSong()' in order to properly parse the input data and load it into a 'song'
+                            # the padding is added by 'ljust()' in 1 call (nothing is added if 'notes' is already long enough)
+                            notes = notes[trim:].ljust(len(gString))
+                    elif stringIdx == 1:
                         dString = arr
-                    elif loadedLines[1] % 5 == 3:
+                    elif stringIdx == 2:
                         aString = arr
-                    elif loadedLines[1] % 5 == 4:
+                    elif stringIdx == 3:
                         eString = arr
-                        # check that the string lists and timing list all have the same length before trying to load the list data into music type objects. Otherwise, 'updateSong()' may run into an indexing error
-                        if len(gString) != len(dString) or len(gString) != len(aString) or len (gString) != len(eString) or len(gString) != len(notes):
-                            raise TabFileException("lists not loaded properly", "The lists holding the strings (lengths = {0}, {1}, {2}, {3}) and the list holding the timing ({4}) must have the same length.".format(len(gString), len(dString), len(aString), len(eString), len(notes)), line=loadedLines[0])
+                        # check that the string lists (and timing list if timing was supplied) all have the same length before trying to load the list data into music type objects. Otherwise, 'updateSong()' may run into an indexing error
+                        numColumns = len(gString)
+                        if numColumns != len(dString) or numColumns != len(aString) or numColumns != len(eString) or (hasTiming and numColumns != len(notes)):
+                            if hasTiming:
+                                raise TabFileException("lists not loaded properly", "The lists holding the strings (lengths = {0}, {1}, {2}, {3}) and the list holding the timing ({4}) must have the same length.".format(len(gString), len(dString), len(aString), len(eString), len(notes)), line=lineIdx)
+                            raise TabFileException("lists not loaded properly", "The lists holding strings (lengths = {0}, {1}, {2}, {3}) must have the same length.".format(len(gString), len(dString), len(aString), len(eString)), line=lineIdx)
                         # if there has been separating text associated with the current set of measures, then it would have been stored in the extra text entry for the measure that would follow the current last measure (see doc. for where separating text
                         # is added - some 15 lines or so below). If this is the case, add a newline character so that the starting text is placed below it.
                         if song.measureHasStartingExtraText(song.numMeasures() + 1):
@@ -328,86 +416,38 @@ def buildSong(lines, song, rdr, loadedLines):
                         # place all the collected preceding extra text to be be before the 1st measure of the set of measures to be added.
                         # That is, before the measure that will come after the current last measure (indexed by Song.numMeasures() in Song.extraText)
                         # for more - see doc. for 'placeExtraLine()'
-                        song.placeExtraLine(startingText, song.numMeasures() + 1, ExtraTextPlacementOption.START_OF_LINE)
+                        placeExtraLine(startingText, song.numMeasures() + 1, ExtraTextPlacementOption.START_OF_LINE)
                         startingText = "" # reset it now that the set of measures will be added
                         try:
                             lastSlice = updateSong(song, notes, gString, dString, aString, eString, lastSlice)
                         except TabFileException as fe: # catch exception from 'updateSong()' and provide better info. to user by giving line no.
-                            raise TabFileException(fe.issue, fe.reason, line=loadedLines[0]+1)
-                        # place all the collected preceding extra text to be be after the ;ast measure of the set of measures that were added.
+                            raise TabFileException(fe.issue, fe.reason, line=lineIdx+1)
+                        # place all the collected preceding extra text to be be after the last measure of the set of measures that were added.
                         # That is, after after the current last measure (indexed by Song.numMeasures() in Song.extraText)
                         # for more - see doc. for 'placeExtraLine()'
-                        song.placeExtraLine(endingText, song.numMeasures(), ExtraTextPlacementOption.END_OF_LINE)
+                        placeExtraLine(endingText, song.numMeasures(), ExtraTextPlacementOption.END_OF_LINE)
                         endingText = "" # reset it now that the set of measures have been added
-                    loadedLines[1] += 1
-                else: # otherwise, this is a line of extra text separating timing & string lines. Place it above the sheet music starting with 1st of the next set of measures to be added.
-                      # That is, before the measure tjat will come after the current last measure (indexed by Song.numMeasures() in Song.extraText) for more - see doc. for 'placeExtraLine()'
-                      # the set of measures will be added once 'updateSong()' is called after the G-string has been parsed.
-                    if keepExtra:
-                        song.placeExtraLine(sLine, song.numMeasures() + 1, ExtraTextPlacementOption.START_OF_LINE)
-        else: # the user has specified that no timing was supplied -> read lines in groups of 4
-            arr = list()
-            orig = len(sLine) # len. of char. string before any changes
-            if hasExtra: # if there is extra text, extract string data into a match object with 3 groups: group 1 is the extra text before the string data, group 2 is the string data, and group 3 is the extra text after the string data
-                match = extractStringData(sLine)
-                if match is not None: # match object was created successfully, so string data was found.
-                    arr = list(match.group(2))
-                    if keepExtra:
-                        # save the starting and ending extra text using helper 'saveSameLineExtraText()' by extracting capture group data from the regex match
-                        startingText = saveSameLineExtraText(startingText, removeStringName(match.group(1), Song.STRING_NAMES[loadedLines[1] % 4], loadedLines[0] + 1))
-                        endingText = saveSameLineExtraText(endingText, match.group(3))
-                # else: this line does not have string data as the match was either None or not created properly
-            else: # if there's no extra text, should only be whitespace at the start -> strip it
-                arr = list(sLine.lstrip())
-                if arr[0].isalpha(): # if the first non-whitespace char. in 'arr' is in the alphabet, it must be the correct string name corresponding to the current string to be parsed.
-                    checkChrToStringName(arr[0].upper(), Song.STRING_NAMES[loadedLines[1] % 4], loadedLines[0] + 1)
-            if not hasExtra or match is not None:
-                if loadedLines[1] % 4 == 0:
-                    gString = arr
-                elif loadedLines[1] % 4 == 1:
-                    dString = arr
-                elif loadedLines[1] % 4 == 2:
-                    aString = arr
-                elif loadedLines[1] % 4 == 3:
-                    eString = arr
-                    # check that the string lists have the same length before trying to load the list data into music type objects. Otherwise, 'updateSong()' may run into an indexing error
-                    if len(gString) != len(dString) or len(gString) != len(aString) or len(gString) != len(eString):
-                        raise TabFileException("lists not loaded properly", "The lists holding strings (lengths = {0}, {1}, {2}, {3}) must have the same length.".format(len(gString), len(dString), len(aString), len(eString)), line=loadedLines[0])
-                    # if there has been separating text associated with the current set of measures, then it would have been stored in the extra text entry for the measure that would follow the current last measure (see doc. for where separating text
-                    # is added - some 15 lines or so below). If this is the case, add a newline character so that the starting text is placed below it.
-                    if song.measureHasStartingExtraText(song.numMeasures() + 1):
-                        startingText = "\n" + startingText
-                    # place all the collected preceding extra text to be be before the 1st measure of the set of measures to be added.
-                    # That is, before the measure that will come after the current last measure (indexed by Song.numMeasures() in Song.extraText)
-                    # for more - see doc. for 'placeExtraLine()'
-                    song.placeExtraLine(startingText, song.numMeasures() + 1, ExtraTextPlacementOption.START_OF_LINE)
-                    startingText = "" # reset it now that the set of measures will be added
-                    try:
-                        lastSlice = updateSong(song, notes, gString, dString, aString, eString, lastSlice)
-                    except TabFileException as fe: 
-                        raise TabFileException(fe.issue, fe.reason, line=loadedLines[0]+1) # catch exception from 'updateSong()' and provide better info. to user by giving line no.
-                    # place all the collected preceding extra text to be be after the last measure of the set of measures that were added.
-                    # That is, after after the current last measure (indexed by Song.numMeasures() in Song.extraText)
-                    # for more - see doc. for 'placeExtraLine()'
-                    song.placeExtraLine(endingText, song.numMeasures(), ExtraTextPlacementOption.END_OF_LINE)
-                    endingText = "" # reset it now that the set of measures have been added
-                loadedLines[1] += 1
-            else:
-                if keepExtra: # if the user desires to save extra text
-                    # if the g-string hasn't been found, this is a line of extra text before a set of measures. In this case, record it as a line of extra text following the current number of measures in Song
-                    if loadedLines[1] % 4 == 0:
-                        song.placeExtraLine(sLine, song.numMeasures(), ExtraTextPlacementOption.FOLLOWING_LINE)
-                    # otherwise, this is a line of extra text separating timing & string lines. Place it above the sheet music starting with 1st of the next set of measures to be added.
-                    # That is, before the measure that will come after the current last measure (indexed by Song.numMeasures() in Song.extraText). for more - see doc. for 'placeExtraLine()'
-                    # the set of measures will be added once 'updateSong()' is called after the G-string has been parsed.
-                    else:
-                        song.placeExtraLine(sLine, song.numMeasures() + 1, ExtraTextPlacementOption.START_OF_LINE)
-        loadedLines[0] += 1 # mark that a line has been read
-
-    if (hasTiming and loadedLines[1] % 5 != 0) or (not hasTiming and loadedLines[1] % 4 != 0): # if timing was supplied, count should be a multiple of 5 and if not it should be a multiple of 4
+                    stringCount += 1
+                    phase = 0 if phase == groupSize - 1 else phase + 1
+                else:
+                    if keepExtra: # if the user desires to save extra text
+                        # if no string/timing line of the group has been found (only possible when timing was not supplied), this is a line of extra text before a set of measures. In this case, record it as a line of extra text following the current number of measures in Song
+                        if phase == 0:
+                            placeExtraLine(sLine, song.numMeasures(), ExtraTextPlacementOption.FOLLOWING_LINE)
+                        # otherwise, this is a line of extra text separating timing & string lines. Place it above the sheet music starting with 1st of the next set of measures to be added.
+                        # That is, before the measure that will come after the current last measure (indexed by Song.numMeasures() in Song.extraText). for more - see doc. for 'placeExtraLine()'
+                        # the set of measures will be added once 'updateSong()' is called after the G-string has been parsed.
+                        else:
+                            placeExtraLine(sLine, song.numMeasures() + 1, ExtraTextPlacementOption.START_OF_LINE)
+            lineIdx += 1 # mark that a line has been read
+    finally:
+        loadedLines[0] = lineIdx
+        loadedLines[1] = stringCount
+
+    if phase != 0: # if timing was supplied, count should be a multiple of 5 and if not it should be a multiple of 4
         errorMsg = ""
         if hasTiming:
-            errorMsg = "The number of lines interpreted as strings and timing identifiers ({0}) is incorrect, should be a multiple of 5".format(loadedLines[1])
+            errorMsg = "The number of lines interpreted as strings and timing identifiers ({0}) is incorrect, should be a multiple of 5".format(stringCount)
         else:
-            errorMsg = "The number of lines interpreted as strings ({0}) is incorrect, should be a multiple of 4".format(loadedLines[1])
+            errorMsg = "The number of lines interpreted as strings ({0}) is incorrect, should be a multiple of 4".format(stringCount)
         raise TabFileException("input file line count incorrect", errorMsg)
@@ -22,6 +22,11 @@ from typeLibrary import Song
 from configUtils import ConfigReader, ConfigOptionID
 from parsingUtils import buildSong
 import time
+import os
+
+HTML_HEAD = "<!DOCTYPE HTML><html><title>{0} staff </title><body><pre>" # written before the sheet music in the output HTML file, {0} is replaced by the input file's name
+HTML_TAIL = "</pre></body></html>" # written after the sheet music in the output HTML file
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"}) # escapes the characters that would otherwise be read as markup inside the <pre> block (e.g. if they appear in extra text), applied to each piece of sheet music in 1 pass by 'str.translate()'
 
 """
 Reads the input tab file and loads into a Song object using helper 'buildSong()'
@@ -64,18 +69,17 @@ def run(logger):
 
         logger.log("The contents of the configuration file were read successfully. Beginning tab-reading...")
 
-        try: # try to load list of strings from tab input file and raise a more appropriate exception than IOError to the user if one occurs
+        try: # try to read the lines of the tab input file and raise a more appropriate exception than IOError to the user if one occurs
             with open(inFilename) as inputFile:
-                lines = inputFile.readlines()
-            logger.log("Input tab file \"{0}\" was opened and closed successfully.".format(inFilename))
+                logger.log("Input tab file \"{0}\" was opened successfully.".format(inFilename))
+                start = time.time() # the timing starts after the file is opened, as before. Since the lines are parsed as they are read, it includes reading them
+                buildSong(inputFile, song, rdr, loadedLines) # the file is streamed into 'buildSong()' 1 line at a time instead of being loaded into a list of lines first
+            logger.log("Input tab file \"{0}\" was closed successfully.".format(inFilename))
         except IOError as i:
-            raise TabIOException("opening tab file", str(i))
-
-        start = time.time()
-        buildSong(lines, song, rdr, loadedLines)
+            raise TabIOException("reading tab file", str(i))
 
         # log a more detailed report of the result of Song building based on the data in 'loadedLines'
-        logger.log("Song building of the data from \"{0}\" finished without any parsing errors. {1} out of the {2} loaded line(s) were read successfully.".format(inFilename, loadedLines[0], len(lines)))
+        logger.log("Song building of the data from \"{0}\" finished without any parsing errors. {1} line(s) were read successfully.".format(inFilename, loadedLines[0]))
         logStr = ""
         logType = Logger.INFO
         if loadedLines[1] > 0:
@@ -87,11 +91,15 @@ def run(logger):
             logStr += " and timing lines"
         logger.log(type=logType, msg=logStr + ". {0} Measure object(s) were created.".format(song.numMeasures()))
 
-        pathNoExt = inFilename[:-4] # get file path without 4-character extension & use it to create output filename
+        pathNoExt = os.path.splitext(inFilename)[0] # get file path without its extension (of any length) & use it to create output filename
         outFilename = pathNoExt+"_staff.html"
+        title = os.path.basename(pathNoExt) # file name without directories or extension, 'os.path' splits on the separators of the platform the program is running on
         try: # try to write Song output to HTML file and raise a more appropriate exception than IOError to the user if one occurs
             with open(outFilename, "w+", encoding="utf-8") as outFile:
-                outFile.write("<!DOCTYPE HTML><html><title>" + pathNoExt[pathNoExt.rfind("\\")+1:]+" staff </title><body><pre>" + str(song) + "</pre></body></html>")
+                # the sheet music is written in pieces between the HTML tags so that the output is not built up as 1 large character string (and copied) before being written
+                outFile.write(HTML_HEAD.format(title.translate(HTML_ESCAPE_TABLE)))
+                outFile.writelines(chunk.translate(HTML_ESCAPE_TABLE) for chunk in song.staffChunks())
+                outFile.write(HTML_TAIL)
             logger.log("Output HTML file \"{0}\" was opened and Song data was written successfully before closing.".format(outFilename, song.numMeasures(), inFilename))
         except IOError as i:
             raise TabIOException("creating HTML file", str(i))
@@ -150,14 +150,28 @@ class Slice:
     """
     Applies a dot to the Slice. That is, the length of the Slice's time is increased accordingly.
 
-    Raises TabException if object's length has not been set by a call to setLength() (see below)
+    Raises TabException if applyDots() fails (see below)
     """
     def applyDot(self):
-        if self.length == Song.timingLegend[Song.NO_TIMING_SYMBOL]:
+        self.applyDots(1)
+
+    """
+    Applies a number of dots to the Slice at once. That is, the length of the Slice's time is increased as if applyDot() was called 'count' times. Since every dot adds
+    half the time of the dot before it, the total time added is a geometric sum and is computed directly.
+
+    params:
+    count - number of dots to apply, nothing is done if it is 0
+
+    Raises TabException if object's length has not been set by a call to setLength() (see below)
+    """
+    def applyDots(self, count):
+        if count == 0:
+            return
+        if self.length == Song.timingLegend[Song.NO_TIMING_SYMBOL][0]:
             raise TabException("Must have a timing length. Please use 'setLength()'.")
-        self.numDots += 1
-        self.length += self.nextDotLength
-        self.nextDotLength /= 2
+        self.numDots += count
+        self.length += 2 * self.nextDotLength * (1 - 0.5 ** count)
+        self.nextDotLength /= 2 ** count
 
     """
     Returns number of timing dots that have been applied to this Slice.
@@ -442,6 +456,12 @@ tieSymbol - character to be placed before a timing symbol that denotes the Slice
 dotSymbol - character to be placed (can be more than once) after a timing symbol that denotes a Slice's timing is dotted
 allowedTimingChars - characters allowed in timing lines, specified by 'TIMING_SYMBOLS' config. option
 allowedPlayingChars - characters allowed in playing lines, specified by in part by 'PLAYING_LEGEND' config. option
+timingCharSet - set of the characters in 'allowedTimingChars' for quick membership tests, built when the timing data is loaded
+timingLinePattern - compiled regex that matches a line made up entirely of the characters in 'allowedTimingChars', built along with 'timingCharSet'
+timingSymbolPattern - compiled regex that matches any key of 'timingLegend', built when the timing data is loaded as it does not change while a tab is parsed
+dotRunPattern - compiled regex that matches a run of 1 or more 'dotSymbol', built along with 'timingSymbolPattern'
+stringDataPattern - compiled regex that finds the string data in a line using the characters in 'allowedPlayingChars' (see 'parsingUtils.extractStringData()'), rebuilt when the playing legend is loaded
+playingCharSet - set of the characters in 'allowedPlayingChars' for quick membership tests. Only ASCII digits are held, lines with other Unicode digits (which '\d' accepts) are left to the regex in 'parsingUtils.extractStringData()'
 STRING_NAMES - char. string of uppercase letters that holds all allowed string names 
 EXTRA_TEXT_DELIMITER - in the output sheet music, the extra text at the beginning (and the end) of input string lines is placed above (and below) the output sheet music separated by this delimiter.
 """
@@ -452,8 +472,14 @@ class Song:
     timingLegend = {NO_TIMING_SYMBOL : [0, "\u2022"]} # if the length is specified it must be greater than 0. Hence the no timing length mapping = 0
     allowedTimingChars = r' '
     allowedPlayingChars = r'\d\-\|'
+    stringDataPattern = re.compile(r'^([^\|]*)(\|[{0}]+\|)(.*)$'.format(allowedPlayingChars))
+    playingCharSet = frozenset("0123456789-|")
     tieSymbol = None
     dotSymbol = None
+    timingCharSet = frozenset(" ")
+    timingLinePattern = re.compile(r'^[ ]+$')
+    timingSymbolPattern = None
+    dotRunPattern = None
 
     """
     Loads timing data into static variables from 'TIMING_SYMBOLS' config. setting (see configUtils.py doc.).
@@ -476,6 +502,10 @@ class Song:
         Song.timingLegend[symbolList[8]] = [0.015625, "\U0001D163", "\U0001D141"]
         Song.timingLegend[symbolList[9]] = [0.0078125, "\U0001D164", "\U0001D142"]
         Song.allowedTimingChars += re.escape(symbolList)
+        Song.timingCharSet = Song.timingCharSet.union(symbolList)
+        Song.timingLinePattern = re.compile(r'^[{0}]+$'.format(Song.allowedTimingChars))
+        Song.timingSymbolPattern = re.compile(r'[{0}]'.format(re.escape("".join(Song.timingLegend))))
+        Song.dotRunPattern = re.compile(r'(?:{0})+'.format(re.escape(Song.dotSymbol)))
 
     """
     Loads playing legend info. from 'PLAYING_LEGEND' config. setting (see configUtils.py doc.).
@@ -485,6 +515,8 @@ class Song:
     """
     def loadPlayingLegend(playingLegend):
         Song.allowedPlayingChars += re.escape(playingLegend)
+        Song.stringDataPattern = re.compile(r'^([^\|]*)(\|[{0}]+\|)(.*)$'.format(Song.allowedPlayingChars))
+        Song.playingCharSet = Song.playingCharSet.union(playingLegend)
 
     """
     Constructs an empty Song object given a gap size and extra text setting (see class doc.).
@@ -498,18 +530,43 @@ class Song:
         self.extraText = list()
 
     """
-    Adds a Measure to the Song.
+    Checks that a Measure can be added to the Song, that is that its length is 1 (or 0 if it is made up of Slices with no timing info.).
 
     params:
     measure - a Measure
+    count - no. of Measures that would have been created successfully before 'measure' (used in error reporting)
 
-    Raises a MeasureException if measure.validate() fails (see this method's doc.)
+    Raises a MeasureException if the Measure's length is not valid.
     """
-    def addMeasure(self, measure):
+    def validateMeasure(self, measure, count):
         if measure.length != 1 and measure.length != Song.timingLegend[Song.NO_TIMING_SYMBOL][0]: # (0)
-            raise MeasureException("creating a Measure.", "{0} is not a valid Measure length (must be 1). {1} Measure objects have been created successfully.".format(measure.length, self.numMeasures()))          
+            raise MeasureException("creating a Measure.", "{0} is not a valid Measure length (must be 1). {1} Measure objects have been created successfully.".format(measure.length, count))
         # In the case where a Measure is made up of Slices with no timing info., the length of the Measure is 0.
-        self.measures.append(measure)
+
+    """
+    Adds a Measure to the Song.
+
+    params:
+    measure - a Measure
+
+    Raises a MeasureException if 'validateMeasure()' fails (see its doc.)
+    """
+    def addMeasure(self, measure):
+        self.addMeasures((measure,))
+
+    """
+    Adds a sequence of Measures to the Song in order. All of the Measures are checked before any of them are added, then they are added in 1 bulk extend as opposed
+    to appending them 1 at a time.
+
+    params:
+    measures - a sequence of Measures
+
+    Raises a MeasureException if 'validateMeasure()' fails for any of the Measures (see its doc.). In this case, none of the Measures are added.
+    """
+    def addMeasures(self, measures):
+        for count, measure in enumerate(measures, self.numMeasures()): # 'count' is the no. of Measures that would have been created successfully before 'measure'
+            self.validateMeasure(measure, count)
+        self.measures.extend(measures)
 
     """
     Returns the number of Measures in this Song.
@@ -587,34 +644,41 @@ class Song:
         return endingExtraText is not None and endingExtraText != ""
 
     """
-    Returns a sheet music String representation of this Song using StaffString utility class and its String represenation.
+    Generates the sheet music representation of this Song (see '__str__()') in consecutive pieces, so that it can be written out without building the whole
+    character string in memory first.
 
-    Raises a TabFileException if the extra text in the file was not loaded properly.
+    Raises a TabFileException if the extra text in the file was not loaded properly (raised when the 1st piece is requested).
     """
-    def __str__(self):
-        out = list() # list which will be joined to form output character string
-        s = StaffString("|") # temp. var. that will build up groups of Measures that is added to out before being reset. Resets are split up by additions from 'self.extraText' to the output list
+    def staffChunks(self):
+        s = StaffString("|") # temp. var. that will build up groups of Measures that is yielded before being reset. Resets are split up by yields of 'self.extraText'
         if len(self.extraText) > self.numMeasures() + 1:
             raise TabFileException("extra text loading failure", "The length of the extra text list ({0}) is not allowed. It must be less than or equal to {1}.".format(len(self.extraText), self.numMeasures() + 1))
         if self.measureHasFollowingExtraText(0): # if there is any extra text and there is extra text before the 1st measure, add it
-            out.append(self.getMeasureExtraTextAt(0, ExtraTextPlacementOption.FOLLOWING_LINE) + "\n")
-        for i in range(0, self.numMeasures()): # for each Measure in the Song, add it to 's' and place them and any extra text that may follow to the output list before resetting 's'
+            yield self.getMeasureExtraTextAt(0, ExtraTextPlacementOption.FOLLOWING_LINE) + "\n"
+        for i in range(0, self.numMeasures()): # for each Measure in the Song, add it to 's' and yield them and any extra text that may follow before resetting 's'
             if self.measureHasStartingExtraText(i + 1): # if there is extra text before the (i+1)th measure on the same line, place it above the measure's sheet music (hence the "\n")
-                out.append(self.getMeasureExtraTextAt(i + 1, ExtraTextPlacementOption.START_OF_LINE) + "\n")
+                yield self.getMeasureExtraTextAt(i + 1, ExtraTextPlacementOption.START_OF_LINE) + "\n"
             # for any Measure in the Song, add its StaffString to 's' followed by an appropriate bar line
             s.union(self.measures[i].getStaffStr(self.gapsize))
             s.union(self.measures[i].getBarLine())
-            # if there is extra text after the (i+1)th measure (either on the same line or on the following line): add 's' to the output, followed by a new line, than any extra text that may follow - either on the same line or after - separated by "\n"
+            # if there is extra text after the (i+1)th measure (either on the same line or on the following line): yield 's', followed by a new line, than any extra text that may follow - either on the same line or after - separated by "\n"
              # note: this accounts for any extra text that follows all the Measures in the Song because the loop ends when 'i' = 'self.numMeasures()' - 1 and thus 'i' + 1 = 'self.numMeasures()' and thus, in 'self.extraText' denotes the extra text that follows all the Measures in this Song.
             if self.measureHasEndingExtraText(i + 1) or self.measureHasFollowingExtraText(i + 1):
-                out.append(str(s) + "\n")
+                yield str(s) + "\n"
                 if self.measureHasEndingExtraText(i + 1):
-                    out.append(self.getMeasureExtraTextAt(i + 1, ExtraTextPlacementOption.END_OF_LINE) + "\n")
+                    yield self.getMeasureExtraTextAt(i + 1, ExtraTextPlacementOption.END_OF_LINE) + "\n"
                 if self.measureHasFollowingExtraText(i + 1):
-                    out.append(self.getMeasureExtraTextAt(i + 1, ExtraTextPlacementOption.FOLLOWING_LINE) + "\n")
+                    yield self.getMeasureExtraTextAt(i + 1, ExtraTextPlacementOption.FOLLOWING_LINE) + "\n"
                 s = StaffString("|") # reset 's' for future measures being added
         # if the last measure stored in 's' was not followed by some extra text, then it would not have been added to the output in the prev. loop. If 's.width'=1, then nothing was ever added to it (note: it is always initialized to be a measure line & have a width=1).
         # In this case, add it to complete the output sheet music.
         if s.width > 1:
-            out.append(str(s))
-        return "".join(out)
+            yield str(s)
+
+    """
+    Returns a sheet music String representation of this Song using StaffString utility class and its String represenation.
+
+    Raises a TabFileException if the extra text in the file was not loaded properly.
+    """
+    def __str__(self):
+        return "".join(self.staffChunks())